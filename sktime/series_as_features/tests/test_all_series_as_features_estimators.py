@@ -10,6 +10,7 @@ import pandas as pd
 import pytest
 
 from sktime.tests._config import EXCLUDED_ESTIMATORS
+from sktime.tests._config import EXCLUDED_ESTIMATOR_MODULES
 from sktime.tests._config import NON_STATE_CHANGING_METHODS
 from sktime.utils import all_estimators
 from sktime.utils._testing import _construct_instance
@@ -17,19 +18,26 @@ from sktime.utils._testing import _make_args
 
 CLASSIFIERS = [
     e[1]
-    for e in all_estimators(estimator_type="classifier")
+    for e in all_estimators(
+        estimator_type="classifier", exclude_modules=EXCLUDED_ESTIMATOR_MODULES
+    )
     if e[0] not in EXCLUDED_ESTIMATORS
 ]
 
 REGRESSORS = [
     e[1]
-    for e in all_estimators(estimator_type="regressor")
+    for e in all_estimators(
+        estimator_type="regressor", exclude_modules=EXCLUDED_ESTIMATOR_MODULES
+    )
     if e[0] not in EXCLUDED_ESTIMATORS
 ]
 
 SERIES_AS_FEATURES_TRANSFORMERS = [
     e[1]
-    for e in all_estimators(estimator_type="series_as_features_transformer")
+    for e in all_estimators(
+        estimator_type="series_as_features_transformer",
+        exclude_modules=EXCLUDED_ESTIMATOR_MODULES,
+    )
     if e[0] not in EXCLUDED_ESTIMATORS
 ]
 
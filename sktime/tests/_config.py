@@ -3,147 +3,493 @@
 # copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
 
 __author__ = ["Markus Löning"]
-__all__ = ["ESTIMATOR_TEST_PARAMS", "EXCLUDED_ESTIMATORS", "EXCLUDED_TESTS"]
-
-from sklearn.linear_model import LinearRegression
-from sklearn.pipeline import make_pipeline
-from sklearn.preprocessing import StandardScaler
-
-from sktime.classification.compose import ColumnEnsembleClassifier
-from sktime.classification.compose import TimeSeriesForestClassifier
-from sktime.classification.frequency_based import RandomIntervalSpectralForest
-from sktime.classification.interval_based import TimeSeriesForest
-from sktime.classification.shapelet_based import ShapeletTransformClassifier
-from sktime.forecasting.arima import AutoARIMA
-from sktime.forecasting.compose import DirectRegressionForecaster
-from sktime.forecasting.compose import DirectTimeSeriesRegressionForecaster
-from sktime.forecasting.compose import EnsembleForecaster
-from sktime.forecasting.compose import RecursiveRegressionForecaster
-from sktime.forecasting.compose import RecursiveTimeSeriesRegressionForecaster
-from sktime.forecasting.compose import StackingForecaster
-from sktime.forecasting.compose import TransformedTargetForecaster
-from sktime.forecasting.exp_smoothing import ExponentialSmoothing
-from sktime.forecasting.model_selection import ForecastingGridSearchCV
-from sktime.forecasting.model_selection import SingleWindowSplitter
-from sktime.forecasting.naive import NaiveForecaster
-from sktime.forecasting.theta import ThetaForecaster
-from sktime.performance_metrics.forecasting import sMAPE
-from sktime.regression.compose import TimeSeriesForestRegressor
-from sktime.transformers.series_as_features.compose import ColumnTransformer
-from sktime.transformers.series_as_features.compose import RowTransformer
-from sktime.transformers.series_as_features.dictionary_based import SFA
-from sktime.transformers.series_as_features.interpolate import TSInterpolator
-from sktime.transformers.series_as_features.reduce import Tabularizer
-from sktime.transformers.series_as_features.shapelets import ContractedShapeletTransform
-from sktime.transformers.series_as_features.shapelets import ShapeletTransform
-from sktime.transformers.series_as_features.summarize import FittedParamExtractor
-from sktime.transformers.series_as_features.summarize import TSFreshFeatureExtractor
-from sktime.transformers.series_as_features.summarize import (
-    TSFreshRelevantFeatureExtractor,
-)
-from sktime.transformers.single_series.adapt import SingleSeriesTransformAdaptor
-from sktime.transformers.single_series.detrend import Detrender
-
-# TODO fix estimators to pass all tests
-EXCLUDED_ESTIMATORS = [
-    "ElasticEnsemble",
-    "KNeighborsTimeSeriesClassifier",
-    "ProximityForest",
-    "ProximityStump",
-    "ProximityTree",
+__all__ = [
+    "EXCLUDED_ESTIMATORS",
+    "EXCLUDED_ESTIMATOR_MODULES",
+    "EXCLUDED_TESTS",
+    "NON_STATE_CHANGING_METHODS",
+    "get_estimator_constructor",
+    "get_estimator_role",
+    "get_estimator_test_param",
+    "get_estimator_test_params",
+    "get_valid_estimator_types",
+    "is_valid_estimator",
+    "make_forecaster",
+    "make_regressor",
+    "make_time_series_classifier",
+    "make_transformer",
 ]
 
-EXCLUDED_TESTS = {
-    "ShapeletTransformClassifier": ["check_fit_idempotent"],
-    "ContractedShapeletTransform": ["check_fit_idempotent"],
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from functools import partial
+from importlib import import_module
+from types import MappingProxyType
+
+# Estimator classes and the test configuration built from them are resolved
+# lazily through the accessor functions below, so that importing this module
+# does not import any estimator modules. This keeps pytest start-up fast
+# when the common tests are deselected, as heavy transitive dependencies
+# (e.g. statsmodels, tsfresh, numba) are only imported once the
+# configuration is actually requested. Accessor functions rather than
+# module-level attributes are used deliberately: a PEP 562 module
+# __getattr__ would be silently ignored on Python 3.6, which this package
+# still supports.
+_LAZY_IMPORTS = {
+    "clone": "sklearn.base:clone",
+    "LinearRegression": "sklearn.linear_model:LinearRegression",
+    "make_pipeline": "sklearn.pipeline:make_pipeline",
+    "StandardScaler": "sklearn.preprocessing:StandardScaler",
+    "ColumnEnsembleClassifier": "sktime.classification.compose:ColumnEnsembleClassifier",  # noqa: E501
+    "TimeSeriesForestClassifier": "sktime.classification.compose:TimeSeriesForestClassifier",  # noqa: E501
+    "RandomIntervalSpectralForest": "sktime.classification.frequency_based:RandomIntervalSpectralForest",  # noqa: E501
+    "TimeSeriesForest": "sktime.classification.interval_based:TimeSeriesForest",
+    "ShapeletTransformClassifier": "sktime.classification.shapelet_based:ShapeletTransformClassifier",  # noqa: E501
+    "AutoARIMA": "sktime.forecasting.arima:AutoARIMA",
+    "DirectRegressionForecaster": "sktime.forecasting.compose:DirectRegressionForecaster",  # noqa: E501
+    "DirectTimeSeriesRegressionForecaster": "sktime.forecasting.compose:DirectTimeSeriesRegressionForecaster",  # noqa: E501
+    "EnsembleForecaster": "sktime.forecasting.compose:EnsembleForecaster",
+    "RecursiveRegressionForecaster": "sktime.forecasting.compose:RecursiveRegressionForecaster",  # noqa: E501
+    "RecursiveTimeSeriesRegressionForecaster": "sktime.forecasting.compose:RecursiveTimeSeriesRegressionForecaster",  # noqa: E501
+    "StackingForecaster": "sktime.forecasting.compose:StackingForecaster",
+    "TransformedTargetForecaster": "sktime.forecasting.compose:TransformedTargetForecaster",  # noqa: E501
+    "ExponentialSmoothing": "sktime.forecasting.exp_smoothing:ExponentialSmoothing",
+    "ForecastingGridSearchCV": "sktime.forecasting.model_selection:ForecastingGridSearchCV",  # noqa: E501
+    "SingleWindowSplitter": "sktime.forecasting.model_selection:SingleWindowSplitter",
+    "NaiveForecaster": "sktime.forecasting.naive:NaiveForecaster",
+    "ThetaForecaster": "sktime.forecasting.theta:ThetaForecaster",
+    "sMAPE": "sktime.performance_metrics.forecasting:sMAPE",
+    "TimeSeriesForestRegressor": "sktime.regression.compose:TimeSeriesForestRegressor",
+    "ColumnTransformer": "sktime.transformers.series_as_features.compose:ColumnTransformer",  # noqa: E501
+    "RowTransformer": "sktime.transformers.series_as_features.compose:RowTransformer",
+    "SFA": "sktime.transformers.series_as_features.dictionary_based:SFA",
+    "TSInterpolator": "sktime.transformers.series_as_features.interpolate:TSInterpolator",  # noqa: E501
+    "Tabularizer": "sktime.transformers.series_as_features.reduce:Tabularizer",
+    "ContractedShapeletTransform": "sktime.transformers.series_as_features.shapelets:ContractedShapeletTransform",  # noqa: E501
+    "ShapeletTransform": "sktime.transformers.series_as_features.shapelets:ShapeletTransform",  # noqa: E501
+    "FittedParamExtractor": "sktime.transformers.series_as_features.summarize:FittedParamExtractor",  # noqa: E501
+    "TSFreshFeatureExtractor": "sktime.transformers.series_as_features.summarize:TSFreshFeatureExtractor",  # noqa: E501
+    "TSFreshRelevantFeatureExtractor": "sktime.transformers.series_as_features.summarize:TSFreshRelevantFeatureExtractor",  # noqa: E501
+    "SingleSeriesTransformAdaptor": "sktime.transformers.single_series.adapt:SingleSeriesTransformAdaptor",  # noqa: E501
+    "Detrender": "sktime.transformers.single_series.detrend:Detrender",
+    "BaseClassifier": "sktime.classification.base:BaseClassifier",
+    "BaseRegressor": "sktime.regression.base:BaseRegressor",
+    "BaseForecaster": "sktime.forecasting.base._base:BaseForecaster",
+    "BaseSeriesAsFeaturesTransformer": "sktime.transformers.series_as_features.base:BaseSeriesAsFeaturesTransformer",  # noqa: E501
+    "BaseSingleSeriesTransformer": "sktime.transformers.single_series.base:BaseSingleSeriesTransformer",  # noqa: E501
 }
 
-TRANSFORMER = StandardScaler()
-TRANSFORMERS = [
-    ("transformer1", RowTransformer(TRANSFORMER)),
-    ("transformer2", RowTransformer(TRANSFORMER)),
-]
-REGRESSOR = LinearRegression()
-TIME_SERIES_CLASSIFIER = TimeSeriesForest(n_estimators=5, random_state=1)
-TIME_SERIES_CLASSIFIERS = [
-    ("tsf1", TIME_SERIES_CLASSIFIER),
-    ("tsf2", TIME_SERIES_CLASSIFIER),
-]
-FORECASTER = ExponentialSmoothing()
-FORECASTERS = [("ses1", FORECASTER), ("ses2", FORECASTER)]
-STEPS = [
-    ("transformer", Detrender(ThetaForecaster())),
-    ("forecaster", NaiveForecaster()),
-]
-ESTIMATOR_TEST_PARAMS = {
-    DirectRegressionForecaster: {"regressor": REGRESSOR},
-    RecursiveRegressionForecaster: {"regressor": REGRESSOR},
-    DirectTimeSeriesRegressionForecaster: {
-        "regressor": make_pipeline(Tabularizer(), REGRESSOR)
-    },
-    RecursiveTimeSeriesRegressionForecaster: {
-        "regressor": make_pipeline(Tabularizer(), REGRESSOR)
-    },
-    TransformedTargetForecaster: {"steps": STEPS},
-    EnsembleForecaster: {"forecasters": FORECASTERS},
-    StackingForecaster: {"forecasters": FORECASTERS, "final_regressor": REGRESSOR},
-    Detrender: {"forecaster": FORECASTER},
-    ForecastingGridSearchCV: {
-        "forecaster": NaiveForecaster(strategy="mean"),
-        "cv": SingleWindowSplitter(fh=1),
-        "param_grid": {"window_length": [2, 5]},
-        "scoring": sMAPE(),
-    },
-    SingleSeriesTransformAdaptor: {"transformer": StandardScaler()},
-    ColumnEnsembleClassifier: {
-        "estimators": [
-            (name, estimator, 0) for (name, estimator) in TIME_SERIES_CLASSIFIERS
-        ]
-    },
-    FittedParamExtractor: {
-        "forecaster": FORECASTER,
-        "param_names": ["smoothing_level"],
-    },
-    RowTransformer: {"transformer": TRANSFORMER},
-    ColumnTransformer: {
-        "transformers": [(name, estimator, [0]) for name, estimator in TRANSFORMERS]
-    },
-    # ARIMA requires d > start where start = 0 for full in-sample predictions
-    AutoARIMA: {
-        "d": 0,
-        "suppress_warnings": True,
-        "max_p": 2,
-        "max_q": 2,
-        "seasonal": False,
-    },
-    ShapeletTransformClassifier: {"n_estimators": 5, "time_contract_in_mins": 0.125},
-    ContractedShapeletTransform: {"time_contract_in_mins": 0.125},
-    ShapeletTransform: {
-        "max_shapelets_to_store_per_class": 1,
-        "min_shapelet_length": 3,
-        "max_shapelet_length": 4,
-    },
-    TSFreshFeatureExtractor: {"disable_progressbar": True, "show_warnings": False},
-    TSFreshRelevantFeatureExtractor: {
-        "disable_progressbar": True,
-        "show_warnings": False,
-        "ml_task": "classification",
-        "fdr_level": 0.01,
-    },
-    TSInterpolator: {"length": 10},
-    RandomIntervalSpectralForest: {"n_estimators": 5, "acf_lag": 10},
-    SFA: {"return_pandas_data_series": True},
-    TimeSeriesForest: {"n_estimators": 5},
-    TimeSeriesForestClassifier: {"n_estimators": 5},
-    TimeSeriesForestRegressor: {"n_estimators": 5},
+# TODO fix estimators to pass all tests
+# frozensets give O(1) membership checks when filtering the discovered
+# estimators and their checks
+EXCLUDED_ESTIMATORS = frozenset(
+    {
+        "ElasticEnsemble",
+        "KNeighborsTimeSeriesClassifier",
+        "ProximityForest",
+        "ProximityStump",
+        "ProximityTree",
+    }
+)
+
+# modules whose estimators are all in EXCLUDED_ESTIMATORS; estimator
+# discovery for the common tests skips importing these entirely, avoiding
+# e.g. the numba compilation triggered by the distance-based classifiers
+# on every collection
+EXCLUDED_ESTIMATOR_MODULES = frozenset({"sktime.classification.distance_based"})
+
+EXCLUDED_TESTS = {
+    "ShapeletTransformClassifier": frozenset({"check_fit_idempotent"}),
+    "ContractedShapeletTransform": frozenset({"check_fit_idempotent"}),
 }
 
 # these methods should not change the state of the estimator, that is, they should
 # not change fitted parameters or hyper-parameters
-NON_STATE_CHANGING_METHODS = [
-    "predict",
-    "predict_proba",
-    "decision_function",
-    "transform",
-    "inverse_transform",
-]
+# interned frozenset: membership tests inside the check loops reduce to a
+# single hashed comparison instead of a linear scan over the names
+NON_STATE_CHANGING_METHODS = frozenset(
+    map(
+        sys.intern,
+        (
+            "predict",
+            "predict_proba",
+            "decision_function",
+            "transform",
+            "inverse_transform",
+        ),
+    )
+)
+
+
+@lru_cache(maxsize=None)
+def _resolve(name):
+    """Import and return a lazily registered class or function by name."""
+    module, classname = _LAZY_IMPORTS[name].split(":")
+    return getattr(import_module(module), classname)
+
+
+def _prefetch_lazy_modules():
+    """Import all lazily registered modules in parallel.
+
+    When a run exercises the full estimator configuration anyway, cold
+    importing the registered modules serially dominates start-up. Thread
+    workers overlap the disk I/O and C-extension initialisation of the
+    heavy dependencies, during which the GIL is released.
+    """
+    modules = sorted({target.split(":")[0] for target in _LAZY_IMPORTS.values()})
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        # consume the iterator so that import errors are raised here
+        list(executor.map(import_module, modules))
+
+
+# opt-in, e.g. for CI jobs running the complete common test suite; by
+# default all imports stay lazy
+if os.environ.get("SKTIME_PREFETCH", "").lower() in ("1", "true", "yes"):
+    _prefetch_lazy_modules()
+
+
+class _DeferredParam:
+    """Marker for a test parameter that is expensive to construct.
+
+    The wrapped zero-argument factory is invoked each time the test
+    parameters are requested, so deselected tests pay nothing and every
+    test gets a freshly constructed value.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+
+    def __call__(self):
+        return self.factory()
+
+
+@lru_cache(maxsize=None)
+def _make_valid_estimator_base_types():
+    return (
+        _resolve("BaseClassifier"),
+        _resolve("BaseRegressor"),
+        _resolve("BaseForecaster"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_valid_transformer_types():
+    return (
+        _resolve("BaseSeriesAsFeaturesTransformer"),
+        _resolve("BaseSingleSeriesTransformer"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_valid_estimator_types():
+    # BaseEstimator is deliberately not part of this tuple: every
+    # task-specific base class already derives from it, so including it
+    # would only lengthen the MRO walk done by isinstance checks
+    return _make_valid_estimator_base_types() + _make_valid_transformer_types()
+
+
+@lru_cache(maxsize=None)
+def _make_valid_estimator_base_type_lookup():
+    return {
+        "classifier": _resolve("BaseClassifier"),
+        "regressor": _resolve("BaseRegressor"),
+        "forecaster": _resolve("BaseForecaster"),
+        "series_as_features_transformer": _resolve("BaseSeriesAsFeaturesTransformer"),
+        "single_series_transformer": _resolve("BaseSingleSeriesTransformer"),
+    }
+
+
+@lru_cache(maxsize=None)
+def _make_role_by_base_type():
+    # reverse of VALID_ESTIMATOR_BASE_TYPE_LOOKUP, for hashed lookups while
+    # walking an estimator's MRO
+    return {
+        base: role for role, base in _make_valid_estimator_base_type_lookup().items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _role_of_type(cls):
+    role_by_base = _make_role_by_base_type()
+    for base in cls.__mro__:
+        role = role_by_base.get(base)
+        if role is not None:
+            return role
+    return None
+
+
+def get_estimator_role(estimator):
+    """Get the role string for an estimator instance or class.
+
+    Walks the MRO of the concrete class once and caches the result per
+    type, which is cheaper than checking isinstance against each base
+    type in turn. Returns None if no sktime base class matches.
+    """
+    cls = estimator if isinstance(estimator, type) else type(estimator)
+    return _role_of_type(cls)
+
+
+@lru_cache(maxsize=None)
+def _is_valid_estimator_type(cls):
+    return issubclass(cls, _make_valid_estimator_types())
+
+
+def get_valid_estimator_types():
+    """Get the tuple of valid sktime base classes for isinstance checks.
+
+    The tuple is built on first call and cached, so the base class
+    modules are only imported once this is actually needed.
+    """
+    return _make_valid_estimator_types()
+
+
+def is_valid_estimator(estimator):
+    """Check if estimator is an instance of a valid sktime base class.
+
+    The result is cached per concrete type, so repeated checks over
+    instances of the same class reduce to a single dict lookup instead
+    of a full isinstance MRO walk.
+    """
+    return _is_valid_estimator_type(type(estimator))
+
+
+@lru_cache(maxsize=None)
+def _make_transformer():
+    return _resolve("StandardScaler")()
+
+
+@lru_cache(maxsize=None)
+def _make_transformers():
+    # both entries wrap the same transformer with identical arguments, so a
+    # single wrapper is constructed and referenced twice; consumers clone
+    # the entries before fitting
+    row_transformer = _resolve("RowTransformer")(_make_transformer())
+    return [
+        ("transformer1", row_transformer),
+        ("transformer2", row_transformer),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _make_regressor():
+    return _resolve("LinearRegression")()
+
+
+@lru_cache(maxsize=None)
+def _make_time_series_classifier():
+    return _resolve("TimeSeriesForest")(n_estimators=5, random_state=1)
+
+
+@lru_cache(maxsize=None)
+def _make_time_series_classifiers():
+    # each entry gets its own clone: composite estimators fit their
+    # components, and two entries aliasing one instance would be fitted
+    # (and mutated) together
+    clone = _resolve("clone")
+    classifier = _make_time_series_classifier()
+    return [("tsf1", clone(classifier)), ("tsf2", clone(classifier))]
+
+
+@lru_cache(maxsize=None)
+def _make_forecaster():
+    return _resolve("ExponentialSmoothing")()
+
+
+@lru_cache(maxsize=None)
+def _make_forecasters():
+    clone = _resolve("clone")
+    forecaster = _make_forecaster()
+    return [("ses1", clone(forecaster)), ("ses2", clone(forecaster))]
+
+
+# public factories for the shared fixtures: each call returns a fresh,
+# unfitted clone of the cached template, so conftest files can bind them
+# to pytest fixtures of any scope (e.g. scope="session") without tests
+# sharing mutable estimator state behind pytest's back
+def make_transformer():
+    """Return a fresh instance of the shared transformer fixture."""
+    return _resolve("clone")(_make_transformer())
+
+
+def make_regressor():
+    """Return a fresh instance of the shared regressor fixture."""
+    return _resolve("clone")(_make_regressor())
+
+
+def make_time_series_classifier():
+    """Return a fresh instance of the shared time series classifier fixture."""
+    return _resolve("clone")(_make_time_series_classifier())
+
+
+def make_forecaster():
+    """Return a fresh instance of the shared forecaster fixture."""
+    return _resolve("clone")(_make_forecaster())
+
+
+@lru_cache(maxsize=None)
+def _make_tabularized_regression_pipeline_template():
+    make_pipeline = _resolve("make_pipeline")
+    return make_pipeline(_resolve("Tabularizer")(), make_regressor())
+
+
+def _make_tabularized_regression_pipeline():
+    # cloning a cached template runs make_pipeline and its parameter
+    # validation once per process, while each caller still receives an
+    # independent, unfitted pipeline
+    return _resolve("clone")(_make_tabularized_regression_pipeline_template())
+
+
+@lru_cache(maxsize=None)
+def _make_steps():
+    return [
+        ("transformer", _resolve("Detrender")(_resolve("ThetaForecaster")())),
+        ("forecaster", _resolve("NaiveForecaster")()),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _make_estimator_test_params():
+    # keyed by class name, consistent with EXCLUDED_TESTS, so that the keys
+    # themselves force no imports; shared fixtures are constructed once by
+    # the cached factories above and handed out as clones, so that no two
+    # entries alias the same estimator instance and fitting one cannot leak
+    # state into another
+    clone = _resolve("clone")
+    regressor = _make_regressor()
+    forecaster = _make_forecaster()
+    # derived sequences are computed once here rather than inline in the
+    # dict literal; the column index list is shared between the transformer
+    # entries, which only ever read it
+    column_0 = [0]
+    column_ensemble_estimators = [
+        (name, estimator, 0) for name, estimator in _make_time_series_classifiers()
+    ]
+    column_transformers = [
+        (name, estimator, column_0) for name, estimator in _make_transformers()
+    ]
+    params = {
+        "DirectRegressionForecaster": {"regressor": clone(regressor)},
+        "RecursiveRegressionForecaster": {"regressor": clone(regressor)},
+        "DirectTimeSeriesRegressionForecaster": {
+            "regressor": _DeferredParam(_make_tabularized_regression_pipeline)
+        },
+        "RecursiveTimeSeriesRegressionForecaster": {
+            "regressor": _DeferredParam(_make_tabularized_regression_pipeline)
+        },
+        "TransformedTargetForecaster": {"steps": _make_steps()},
+        "EnsembleForecaster": {"forecasters": _make_forecasters()},
+        "StackingForecaster": {
+            "forecasters": _make_forecasters(),
+            "final_regressor": clone(regressor),
+        },
+        "Detrender": {"forecaster": clone(forecaster)},
+        "ForecastingGridSearchCV": {
+            "forecaster": _resolve("NaiveForecaster")(strategy="mean"),
+            "cv": _resolve("SingleWindowSplitter")(fh=1),
+            "param_grid": {"window_length": [2, 5]},
+            "scoring": _resolve("sMAPE")(),
+        },
+        "SingleSeriesTransformAdaptor": {"transformer": _resolve("StandardScaler")()},
+        "ColumnEnsembleClassifier": {"estimators": column_ensemble_estimators},
+        "FittedParamExtractor": {
+            "forecaster": clone(forecaster),
+            "param_names": ["smoothing_level"],
+        },
+        "RowTransformer": {"transformer": clone(_make_transformer())},
+        "ColumnTransformer": {"transformers": column_transformers},
+        # ARIMA requires d > start where start = 0 for full in-sample predictions
+        "AutoARIMA": {
+            "d": 0,
+            "suppress_warnings": True,
+            "max_p": 2,
+            "max_q": 2,
+            "seasonal": False,
+        },
+        "ShapeletTransformClassifier": {
+            "n_estimators": 5,
+            "time_contract_in_mins": 0.125,
+        },
+        "ContractedShapeletTransform": {"time_contract_in_mins": 0.125},
+        "ShapeletTransform": {
+            "max_shapelets_to_store_per_class": 1,
+            "min_shapelet_length": 3,
+            "max_shapelet_length": 4,
+        },
+        "TSFreshFeatureExtractor": {
+            "disable_progressbar": True,
+            "show_warnings": False,
+        },
+        "TSFreshRelevantFeatureExtractor": {
+            "disable_progressbar": True,
+            "show_warnings": False,
+            "ml_task": "classification",
+            "fdr_level": 0.01,
+        },
+        "TSInterpolator": {"length": 10},
+        "RandomIntervalSpectralForest": {"n_estimators": 5, "acf_lag": 10},
+        "SFA": {"return_pandas_data_series": True},
+        "TimeSeriesForest": {"n_estimators": 5},
+        "TimeSeriesForestClassifier": {"n_estimators": 5},
+        "TimeSeriesForestRegressor": {"n_estimators": 5},
+    }
+    # read-only views: the inner dicts are built once and shared, so no
+    # consumer may mutate them; get_estimator_test_params returns a fresh
+    # dict copy on each call
+    return {name: MappingProxyType(config) for name, config in params.items()}
+
+
+@lru_cache(maxsize=None)
+def _make_flat_estimator_test_params():
+    # flat view of the nested configuration, keyed by (class name, param
+    # name) tuples: single-parameter lookups hash one tuple instead of
+    # chaining two dict lookups, and the flat keys make better pytest
+    # parametrization ids than nested dict reprs
+    return MappingProxyType(
+        {
+            (name, param_name): value
+            for name, config in _make_estimator_test_params().items()
+            for param_name, value in config.items()
+        }
+    )
+
+
+def get_estimator_test_param(Estimator, param_name, default=None):
+    """Get a single test parameter value for the given estimator class.
+
+    Looks the value up in the flat (class name, param name) store;
+    deferred parameters are constructed on each call.
+    """
+    value = _make_flat_estimator_test_params().get(
+        (Estimator.__name__, param_name), default
+    )
+    return value() if isinstance(value, _DeferredParam) else value
+
+
+def get_estimator_test_params(Estimator):
+    """Get the test parameter configuration for the given estimator class.
+
+    Returns an empty dict if no non-default parameters are required for
+    testing the estimator. Deferred parameters are constructed on each
+    call, so every test receives a fresh value.
+    """
+    params = _make_estimator_test_params().get(Estimator.__name__, {})
+    return {
+        key: value() if isinstance(value, _DeferredParam) else value
+        for key, value in params.items()
+    }
+
+
+def get_estimator_constructor(Estimator):
+    """Get a zero-argument constructor for Estimator with its test params.
+
+    Returns a functools.partial binding the estimator's test parameter
+    configuration, so the test harness constructs instances with a plain
+    call instead of re-merging keyword dicts at every call site. Deferred
+    parameters are expanded when the partial is built, so each constructor
+    owns fresh copies of expensive parameter values.
+    """
+    return partial(Estimator, **get_estimator_test_params(Estimator))
+
+
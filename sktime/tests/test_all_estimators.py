@@ -9,11 +9,13 @@ __all__ = [
 
 import pytest
 from sktime.tests._config import EXCLUDED_ESTIMATORS
+from sktime.tests._config import EXCLUDED_ESTIMATOR_MODULES
 from sktime.utils import all_estimators
 from sktime.utils._testing.estimator_checks import check_estimator
 from sktime.tests._config import EXCLUDED_TESTS
 
-ALL_ESTIMATORS = [e[1] for e in all_estimators() if
+ALL_ESTIMATORS = [e[1] for e in
+                  all_estimators(exclude_modules=EXCLUDED_ESTIMATOR_MODULES) if
                   e[0] not in EXCLUDED_ESTIMATORS]
 
 
@@ -21,4 +23,4 @@ ALL_ESTIMATORS = [e[1] for e in all_estimators() if
 def test_estimator(Estimator):
     # We run a number of basic checks on all estimators to ensure correct
     # implementation of our framework and compatibility with scikit-learn
-    check_estimator(Estimator, EXCLUDED_TESTS.get(Estimator.__name__, []))
+    check_estimator(Estimator, EXCLUDED_TESTS.get(Estimator.__name__, frozenset()))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3 -u
+# -*- coding: utf-8 -*-
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+
+__author__ = ["Markus Löning"]
+__all__ = []
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_config_import_is_lazy():
+    # importing the test config must not import numpy, sklearn, pandas or
+    # any estimator module: the configuration is resolved lazily on first
+    # use, which keeps pytest collection fast when the common tests are
+    # deselected; a fresh interpreter is used so that modules already
+    # imported by the test runner do not mask eager imports
+    config_path = Path(__file__).parent / "_config.py"
+    script = "\n".join(
+        [
+            "import importlib.util",
+            "import sys",
+            f"spec = importlib.util.spec_from_file_location("
+            f"'_config', {str(config_path)!r})",
+            "module = importlib.util.module_from_spec(spec)",
+            "spec.loader.exec_module(module)",
+            "heavy = sorted(",
+            "    name for name in sys.modules",
+            "    if name.split('.')[0] in ('numpy', 'pandas', 'sklearn', 'sktime')",
+            ")",
+            "assert not heavy, f'eagerly imported: {heavy}'",
+        ]
+    )
+    # strip SKTIME_PREFETCH from the environment: prefetching imports every
+    # registered module by design, which is exactly what this test asserts
+    # does not happen by default
+    env = {key: value for key, value in os.environ.items() if key != "SKTIME_PREFETCH"}
+    # stdout/stderr PIPE with universal_newlines instead of the 3.7+
+    # capture_output/text aliases, as this package still supports Python 3.6
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert result.returncode == 0, result.stderr
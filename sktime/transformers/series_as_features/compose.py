@@ -211,7 +211,8 @@ class RowTransformer(_NonFittableSeriesAsFeaturesTransformer, MetaEstimatorMixin
 
     def transform(self, X, y=None):
         """Apply the `fit_transform()` method of the transformer on each row."""
-        X = check_X(X, coerce_to_pandas=True)
+        # input checks are delegated to _apply_rowwise, so that the data is
+        # validated and coerced only once per call
         func = self.transformer.fit_transform
         return self._apply_rowwise(func, X, y)
 
@@ -8,12 +8,16 @@ __all__ = []
 import numpy as np
 import pytest
 from sktime.tests.test_all_estimators import EXCLUDED_ESTIMATORS
+from sktime.tests._config import EXCLUDED_ESTIMATOR_MODULES
 from sktime.utils import all_estimators
 from sktime.utils._testing import _construct_instance
 from sktime.utils._testing import _make_args
 
 ALL_SERIES_AS_FEATURES_TRANSFORMERS = [
-    e[1] for e in all_estimators("series_as_features_transformer")
+    e[1] for e in all_estimators(
+        "series_as_features_transformer",
+        exclude_modules=EXCLUDED_ESTIMATOR_MODULES,
+    )
     if e[0] not in EXCLUDED_ESTIMATORS
 ]
 
@@ -9,7 +9,7 @@ from operator import itemgetter
 from pathlib import Path
 
 
-def all_estimators(estimator_type=None):
+def all_estimators(estimator_type=None, exclude_modules=None):
     """Get a list of all estimators from sktime.
 
     This function crawls the module and gets all classes that inherit
@@ -28,6 +28,11 @@ def all_estimators(estimator_type=None):
         estimators only of these specific types, or a list of these to
         get the estimators that fit at least one of the types.
 
+    exclude_modules : set of string, optional (default=None)
+        Dotted module names which should not be crawled; submodules of the
+        given modules are skipped as well. Skipped modules are never
+        imported, so their transitive dependencies are not loaded either.
+
     Returns
     -------
     estimators : list of tuples
@@ -61,25 +66,47 @@ def all_estimators(estimator_type=None):
     modules_to_ignore = {"tests", "setup", "contrib"}
     root = str(Path(__file__).parent.parent)  # sktime package
 
+    def is_ignored(modname):
+        mod_parts = modname.split(".")
+        if any(part in modules_to_ignore for part in mod_parts) or "._" in modname:
+            return True
+        return exclude_modules is not None and any(
+            modname == excluded or modname.startswith(excluded + ".")
+            for excluded in exclude_modules
+        )
+
     # Ignore deprecation warnings triggered at import time and from walking
     # packages
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=FutureWarning)
-        for _, modname, _ in pkgutil.walk_packages(path=[root], prefix="sktime."):
-            mod_parts = modname.split(".")
-
-            # filter modules
-            if any(part in modules_to_ignore for part in mod_parts) or "._" in modname:
-                continue
-
-            module = import_module(modname)
-            classes = inspect.getmembers(module, inspect.isclass)
-            classes = [
-                (name, klass)
-                for name, klass in classes
-                if not (name.startswith("_") or name.startswith("Base"))
-            ]
-            all_classes.extend(classes)
+        # walk the package tree manually with iter_modules instead of
+        # pkgutil.walk_packages: walk_packages imports every package it
+        # yields in order to recurse into it, so filtered packages would
+        # still be imported along with their transitive dependencies
+        paths = [(root, "sktime.")]
+        while paths:
+            path, prefix = paths.pop()
+            for _, modname, ispkg in pkgutil.iter_modules(path=[path], prefix=prefix):
+                # filter modules before importing or descending into them,
+                # so that ignored and excluded modules are never loaded
+                if is_ignored(modname):
+                    continue
+
+                module = import_module(modname)
+
+                if ispkg:
+                    paths.extend(
+                        (package_path, modname + ".")
+                        for package_path in module.__path__
+                    )
+
+                classes = inspect.getmembers(module, inspect.isclass)
+                classes = [
+                    (name, klass)
+                    for name, klass in classes
+                    if not (name.startswith("_") or name.startswith("Base"))
+                ]
+                all_classes.extend(classes)
 
     all_classes = set(all_classes)
 
@@ -16,7 +16,7 @@ from pandas.testing import assert_frame_equal
 from sktime.classification.base import is_classifier
 from sktime.forecasting.base._base import is_forecaster
 from sktime.regression.base import is_regressor
-from sktime.tests._config import ESTIMATOR_TEST_PARAMS
+from sktime.tests._config import get_estimator_constructor
 from sktime.transformers.series_as_features.base import (
     is_series_as_features_transformer,
 )
@@ -33,13 +33,10 @@ from sktime.utils.data_container import is_nested_dataframe
 def _construct_instance(Estimator):
     """Construct Estimator instance if possible"""
 
-    # construct with parameter configuration for testing
-    if Estimator in ESTIMATOR_TEST_PARAMS:
-        params = ESTIMATOR_TEST_PARAMS[Estimator]
-        estimator = Estimator(**params)
+    # the constructor binds the parameter configuration for testing, if any
+    constructor = get_estimator_constructor(Estimator)
 
-    # otherwise construct with default parameters
-    else:
+    if not constructor.keywords:
         # if non-default parameters are required, but none have been found,
         # raise error
         if hasattr(Estimator, "_required_parameters"):
@@ -51,10 +48,7 @@ def _construct_instance(Estimator):
                     f"but none have been found"
                 )
 
-        # construct with default parameters if none are required
-        estimator = Estimator()
-
-    return estimator
+    return constructor()
 
 
 def _make_args(estimator, method, **kwargs):
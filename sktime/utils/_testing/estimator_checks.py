@@ -8,6 +8,7 @@ __author__ = ["Markus Löning"]
 __all__ = ["check_estimator"]
 
 import numbers
+import os
 import pickle
 import types
 from copy import deepcopy
@@ -24,24 +25,20 @@ from sklearn.utils.estimator_checks import check_set_params as _check_set_params
 from sklearn.utils.testing import set_random_state
 
 from sktime.base import BaseEstimator
-from sktime.classification.base import BaseClassifier
 from sktime.classification.base import is_classifier
 from sktime.exceptions import NotFittedError
-from sktime.forecasting.base._base import BaseForecaster
 from sktime.forecasting.base._base import is_forecaster
-from sktime.regression.base import BaseRegressor
 from sktime.regression.base import is_regressor
 from sktime.tests._config import NON_STATE_CHANGING_METHODS
-from sktime.transformers.series_as_features.base import BaseSeriesAsFeaturesTransformer
+from sktime.tests._config import get_estimator_test_params
+from sktime.tests._config import get_valid_estimator_types
 from sktime.transformers.series_as_features.base import (
     is_non_fittable_series_as_features_transformer,
 )
 from sktime.transformers.series_as_features.base import (
     is_series_as_features_transformer,
 )
-from sktime.transformers.single_series.base import BaseSingleSeriesTransformer
 from sktime.transformers.single_series.base import is_single_series_transformer
-from sktime.utils._testing import ESTIMATOR_TEST_PARAMS
 from sktime.utils._testing import _assert_array_almost_equal
 from sktime.utils._testing import _assert_array_equal
 from sktime.utils._testing import _construct_instance
@@ -49,6 +46,20 @@ from sktime.utils._testing import _get_args
 from sktime.utils._testing import _make_args
 
 
+# Opt-in on-disk cache for fitted estimators, keyed on the estimator
+# (class, parameters and random state) and the fit arguments. Point the
+# SKTIME_FIT_CACHE environment variable at a directory to enable it, e.g.
+# to share fits across pytest-xdist workers; by default no caching is done.
+# Only checks for which fitting is a prerequisite rather than the behaviour
+# under test use the cache.
+_FIT_CACHE = joblib.Memory(os.environ.get("SKTIME_FIT_CACHE"), verbose=0)
+
+
+@_FIT_CACHE.cache
+def _cached_fit(estimator, fit_args):
+    return estimator.fit(*fit_args)
+
+
 def check_estimator(Estimator, exclude=None):
     """Check whether estimator complies with common interface.
 
@@ -127,18 +138,15 @@ def check_inheritance(Estimator):
     # estimator
 
     # Class checks
-    base_classes = [
-        BaseClassifier,
-        BaseRegressor,
-        BaseForecaster,
-        BaseSeriesAsFeaturesTransformer,
-        BaseSingleSeriesTransformer,
-    ]
     assert issubclass(Estimator, BaseEstimator), (
         f"Estimator: {Estimator} " f"is not a sub-class of " f"BaseEstimator."
     )
+    valid_estimator_types = get_valid_estimator_types()
     assert (
-        sum([issubclass(Estimator, base_class) for base_class in base_classes]) == 1
+        sum(
+            [issubclass(Estimator, base_class) for base_class in valid_estimator_types]
+        )
+        == 1
     ), (
         f"Estimator: {Estimator} is a "
         f"sub-class of more than one "
@@ -249,7 +257,7 @@ def check_constructor(Estimator):
     # Filter out required parameters with no default value and parameters
     # set for running tests
     required_params = getattr(estimator, "_required_parameters", [])
-    test_config_params = ESTIMATOR_TEST_PARAMS.get(Estimator, {}).keys()
+    test_config_params = get_estimator_test_params(Estimator).keys()
 
     init_params = [
         param
@@ -400,8 +408,10 @@ def check_methods_do_not_change_state(Estimator):
     estimator = _construct_instance(Estimator)
     set_random_state(estimator)
 
-    fit_args = _make_args(estimator, "fit")
-    estimator.fit(*fit_args)
+    # fixed random state for the training data, so that the fit-cache key
+    # is reproducible across checks, workers and sessions
+    fit_args = _make_args(estimator, "fit", random_state=42)
+    estimator = _cached_fit(estimator, fit_args)
     dict_before = estimator.__dict__.copy()
 
     for method in NON_STATE_CHANGING_METHODS:
@@ -427,8 +437,10 @@ def check_persistence_via_pickle(Estimator):
     # Check that we can pickle all estimators
     estimator = _construct_instance(Estimator)
     set_random_state(estimator)
-    fit_args = _make_args(estimator, "fit")
-    estimator.fit(*fit_args)
+    # fixed random state keeps the fit-cache key reproducible, see
+    # check_methods_do_not_change_state
+    fit_args = _make_args(estimator, "fit", random_state=42)
+    estimator = _cached_fit(estimator, fit_args)
 
     # Generate results before pickling
     results = dict()